@@ -1,50 +1,69 @@
 import http.server
-import socketserver
+import socket
 import json
+import re
 import argparse
 import sys
 import threading
 
+MODEL_PLACEHOLDER = b'"__MODEL__"'
+DEFAULT_MODEL = b'"mock-model"'
+# Matches the "model" string value, keeping its JSON escapes intact. Only a
+# top-level string model is supported: the first "model" key anywhere in the
+# body wins (even one nested in e.g. metadata), and non-string values fall
+# back to DEFAULT_MODEL.
+MODEL_PATTERN = re.compile(rb'"model"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+def build_response_template(server_id):
+    # Simple OpenAI Chat Completion response; only the model varies per request
+    response = {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": 1677652288,
+        "model": "__MODEL__",
+        "choices": [{
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": f"Response from {server_id}"
+            },
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": 9,
+            "completion_tokens": 12,
+            "total_tokens": 21
+        }
+    }
+    return json.dumps(response, separators=(",", ":")).encode('utf-8')
+
 class MockHandler(http.server.BaseHTTPRequestHandler):
+    # Keep connections open so clients can reuse them across requests
+    protocol_version = "HTTP/1.1"
+    response_prefix = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+
     def do_POST(self):
         try:
             content_length = int(self.headers.get('Content-Length', 0))
             post_data = self.rfile.read(content_length)
-            try:
-                body = json.loads(post_data.decode('utf-8'))
-            except json.JSONDecodeError:
-                body = {}
-            
-            # Simple OpenAI Chat Completion response
-            response = {
-                "id": "chatcmpl-mock",
-                "object": "chat.completion",
-                "created": 1677652288,
-                "model": body.get("model", "mock-model"),
-                "choices": [{
-                    "index": 0,
-                    "message": {
-                        "role": "assistant",
-                        "content": f"Response from {self.server.server_id}"
-                    },
-                    "finish_reason": "stop"
-                }],
-                "usage": {
-                    "prompt_tokens": 9,
-                    "completion_tokens": 12,
-                    "total_tokens": 21
-                }
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            match = MODEL_PATTERN.search(post_data)
+            model = match.group(1) if match else DEFAULT_MODEL
+            payload = self.server.response_template.replace(MODEL_PLACEHOLDER, model)
+
+            # Status line, headers and body go out in a single write
+            # parse_request sets close_connection for HTTP/1.0 or "Connection: close"
+            connection = b"close" if self.close_connection else b"keep-alive"
+            self.wfile.write(
+                self.response_prefix
+                + b"Connection: %s\r\nContent-Length: %d\r\n\r\n" % (connection, len(payload))
+                + payload
+            )
         except Exception as e:
             self.send_error(500, str(e))
 
     def do_GET(self):
         self.send_response(200)
+        self.send_header('Content-Length', '2')
         self.end_headers()
         self.wfile.write(b"OK")
     
@@ -52,12 +71,37 @@ class MockHandler(http.server.BaseHTTPRequestHandler):
         # Silence logs
         pass
 
-def run(port, server_id):
+class MockServer(http.server.ThreadingHTTPServer):
     # Allow reuse address to avoid "Address already in use" errors during quick restarts
-    socketserver.TCPServer.allow_reuse_address = True
+    allow_reuse_address = True
+    # Handler threads must not block shutdown
+    daemon_threads = True
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        # Small responses otherwise stall on Nagle + delayed ACK (~40ms each)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock, addr
+
+def create_server(port, server_id):
     # Bind to all interfaces for Docker compatibility
-    with socketserver.TCPServer(("0.0.0.0", port), MockHandler) as httpd:
-        httpd.server_id = server_id
+    httpd = MockServer(("0.0.0.0", port), MockHandler)
+    httpd.server_id = server_id
+    httpd.response_template = build_response_template(server_id)
+    return httpd
+
+def start_in_thread(port, server_id):
+    # The socket is listening once created, so callers need not wait for readiness.
+    # A short poll interval keeps shutdown() from blocking for the default 0.5s.
+    httpd = create_server(port, server_id)
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    return httpd, thread
+
+def run(port, server_id):
+    with create_server(port, server_id) as httpd:
         # print(f"Mock Server {server_id} running on port {port}")
         try:
             httpd.serve_forever()
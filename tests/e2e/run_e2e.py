@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+import errno
+import select
 import socket
 import subprocess
 import json
@@ -13,6 +15,11 @@ console = Console()
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 RUNTIME_DIR = ROOT_DIR / ".run" / "e2e"
+# Resolved like cargo: CARGO_TARGET_DIR (relative to the repo root) or target/.
+# A build.target-dir in .cargo/config.toml is not honoured; export the env var instead.
+TARGET_DIR = ROOT_DIR / os.environ.get("CARGO_TARGET_DIR", "target")
+APEX_BIN = TARGET_DIR / "debug" / "apex"
+E2E_CONFIG_BIN = TARGET_DIR / "debug" / "apex-e2e-config"
 ENV_FILE = Path(os.environ.get("APEX_ENV_FILE", ROOT_DIR / ".env.e2e"))
 CONFIG_PATH = Path(
     os.environ.get("APEX_CONFIG", RUNTIME_DIR / "generated.e2e.config.json")
@@ -23,20 +30,26 @@ SERVER_LOG = Path(
 DEFAULT_PROTOCOLS = "openai,anthropic"
 
 
+def build_binaries():
+    console.print("[bold blue]Building Apex...[/bold blue]")
+    subprocess.run(
+        ["cargo", "build", "--bin", "apex", "--bin", "apex-e2e-config"],
+        check=True,
+        cwd=ROOT_DIR,
+    )
+
+
 def generate_config():
     if not ENV_FILE.exists():
         raise FileNotFoundError(
             f"{ENV_FILE} does not exist. Copy .env.e2e.example to .env.e2e first."
         )
 
+    build_binaries()
     console.print("[bold blue]Generating E2E Config...[/bold blue]")
     subprocess.run(
         [
-            "cargo",
-            "run",
-            "--bin",
-            "apex-e2e-config",
-            "--",
+            str(E2E_CONFIG_BIN),
             "--env-file",
             str(ENV_FILE),
             "--output",
@@ -68,34 +81,47 @@ def load_generated_runtime():
 def run_server():
     console.print("[bold blue]Starting Apex Server...[/bold blue]")
     SERVER_LOG.parent.mkdir(parents=True, exist_ok=True)
-    log_file = open(SERVER_LOG, "w")
-    return subprocess.Popen(
-        [
-            "cargo",
-            "run",
-            "--bin",
-            "apex",
-            "--",
-            "gateway",
-            "start",
-            "--config",
-            str(CONFIG_PATH),
-        ],
-        cwd=ROOT_DIR,
-        stdout=log_file,
-        stderr=subprocess.STDOUT,
-    )
+    # The child keeps its own copy of the descriptor, so ours can be closed
+    with open(SERVER_LOG, "w") as log_file:
+        return subprocess.Popen(
+            [
+                str(APEX_BIN),
+                "gateway",
+                "start",
+                "--config",
+                str(CONFIG_PATH),
+            ],
+            cwd=ROOT_DIR,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
 
 
 def wait_for_server(host: str, port: int, timeout: int = 10) -> bool:
-    start = time.time()
-    while time.time() - start < timeout:
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
         try:
-            with socket.create_connection((host, port), timeout=1):
-                return True
+            family, socktype, proto, _, address = socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )[0]
+            with socket.socket(family, socktype, proto) as sock:
+                sock.setblocking(False)
+                err = sock.connect_ex(address)
+                if err in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    # A refused connect completes immediately, so select only
+                    # blocks while the handshake is genuinely in flight
+                    _, writable, _ = select.select([], [sock], [], remaining)
+                    if writable and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
         except OSError:
-            time.sleep(0.5)
-    return False
+            pass
+        # Back off exponentially so a quick start is noticed within a few ms
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 0.2)
 
 
 def main():
@@ -1,16 +1,19 @@
 import os
 import sys
+import time
 import json
 import argparse
+import functools
 import urllib.error
 import urllib.request
-from typing import Callable, List, Dict, Any, Optional
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple
 from openai import OpenAI
 from anthropic import Anthropic
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.prompt import Prompt
+from rich.text import Text
 
 console = Console()
 
@@ -24,13 +27,7 @@ def load_api_key(router_type: str) -> Optional[str]:
     api_key = os.environ.get("APEX_TEAM_KEY") or os.environ.get("APEX_VKEY")
     if api_key:
         return api_key
-    config_path = os.environ.get("APEX_CONFIG", "tests/e2e/manual_config.json")
-    try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-    except Exception:
-        return None
-
+    config = load_config()
     teams = config.get("teams", [])
     if teams:
         team_key = teams[0].get("api_key")
@@ -38,15 +35,20 @@ def load_api_key(router_type: str) -> Optional[str]:
             return team_key
 
     # Backward-compatible fallback for older E2E configs
-    routers = config.get("routers", [])
-    for router in routers:
-        if router.get("type") == router_type and router.get("vkey"):
-            return router.get("vkey")
-    for router in routers:
-        if router.get("vkey"):
-            return router.get("vkey")
-    return None
+    vkeys_by_type, any_vkey = load_router_vkeys()
+    return vkeys_by_type.get(router_type) or any_vkey
+
+@functools.lru_cache(maxsize=1)
+def load_router_vkeys() -> Tuple[Dict[str, str], Optional[str]]:
+    vkeys_by_type: Dict[str, str] = {}
+    for router in load_config().get("routers", []):
+        vkey = router.get("vkey")
+        if vkey:
+            # The first router of each type wins, matching the old linear scan
+            vkeys_by_type.setdefault(router.get("type"), vkey)
+    return vkeys_by_type, next(iter(vkeys_by_type.values()), None)
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     config_path = os.environ.get("APEX_CONFIG", "tests/e2e/manual_config.json")
     try:
@@ -342,11 +344,30 @@ def run_auto_mode(protocols: List[str]) -> int:
     console.print("[bold green]All Automated Tests Passed![/bold green]")
     return 0
 
+LIVE_UPDATE_INTERVAL = 0.1
+
+def render_stream(deltas: Iterable[str]) -> str:
+    # Show plain Text at most every LIVE_UPDATE_INTERVAL seconds while streaming,
+    # and only parse the full response as Markdown once the stream ends.
+    full_response = ""
+    last_update = time.monotonic()
+    with Live(Text(""), refresh_per_second=10) as live:
+        for delta in deltas:
+            full_response += delta
+            now = time.monotonic()
+            if now - last_update >= LIVE_UPDATE_INTERVAL:
+                live.update(Text(full_response))
+                last_update = now
+        live.update(Markdown(full_response))
+    return full_response
+
 def run_interactive_mode(protocol="openai"):
     console.print(f"[bold green]Starting Interactive Mode ({protocol})[/bold green]")
     console.print("Type 'exit' or 'quit' to stop.")
     
     messages = []
+    # Built on the first turn and reused so its connection pool carries over
+    client = None
     
     while True:
         user_input = Prompt.ask("[bold yellow]User[/bold yellow]")
@@ -358,25 +379,25 @@ def run_interactive_mode(protocol="openai"):
         console.print("[bold cyan]Apex[/bold cyan]: ", end="")
         
         try:
-            full_response = ""
             if protocol == "openai":
-                client = get_openai_client()
+                if client is None:
+                    client = get_openai_client()
                 stream = client.chat.completions.create(
                     model=TEST_MODEL,
                     messages=messages,
                     stream=True
                 )
-                with Live(Markdown(""), refresh_per_second=10) as live:
-                    for chunk in stream:
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            full_response += content
-                            live.update(Markdown(full_response))
+                full_response = render_stream(
+                    chunk.choices[0].delta.content
+                    for chunk in stream
+                    if chunk.choices[0].delta.content
+                )
                 console.print() # Newline
                 messages.append({"role": "assistant", "content": full_response})
                 
             elif protocol == "anthropic":
-                client = get_anthropic_client()
+                if client is None:
+                    client = get_anthropic_client()
                 # Anthropic doesn't support persistent history in same way, we pass full history?
                 # Anthropic SDK handles history if we manage the list.
                 # But Anthropic API doesn't allow 'system' messages in the middle, and strict role alternating.
@@ -387,10 +408,7 @@ def run_interactive_mode(protocol="openai"):
                     messages=messages,
                     model=TEST_MODEL,
                 ) as stream:
-                     with Live(Markdown(""), refresh_per_second=10) as live:
-                        for text in stream.text_stream:
-                            full_response += text
-                            live.update(Markdown(full_response))
+                    full_response = render_stream(stream.text_stream)
                 console.print()
                 messages.append({"role": "assistant", "content": full_response})
                 
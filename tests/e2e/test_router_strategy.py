@@ -2,58 +2,76 @@ import json
 import os
 import socket
 import subprocess
-import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
+
+from mock_server import start_in_thread
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 APEX_BIN = ROOT_DIR / "target" / "debug" / "apex"
 RUNTIME_DIR = ROOT_DIR / ".run" / "e2e" / "router_strategy"
 CONFIG_PATH = RUNTIME_DIR / "temp_router_config.json"
 SERVER_LOG = RUNTIME_DIR / "router_strategy_server.log"
-MOCK_SERVER_SCRIPT = Path(__file__).parent / "mock_server.py"
+
+# Reuse keep-alive connections to Apex across requests instead of reconnecting each time
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
 
 
-def wait_for_server(host: str, port: int, timeout: int = 10) -> bool:
+def wait_for_server(
+    host: str, port: int, timeout: int = 10, proc: subprocess.Popen | None = None
+) -> bool:
     start = time.time()
     while time.time() - start < timeout:
+        # Stop polling as soon as the process we are waiting on has exited
+        if proc is not None and proc.poll() is not None:
+            return False
         try:
-            with socket.create_connection((host, port), timeout=1):
+            with socket.create_connection((host, port), timeout=0.1):
                 return True
         except OSError:
-            time.sleep(0.2)
+            time.sleep(0.02)
     return False
 
 
+@pytest.fixture(scope="module", autouse=True)
+def http_session():
+    yield _SESSION
+    _SESSION.close()
+
+
+def stop_mock_servers(servers):
+    for httpd, thread in servers:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+
 @pytest.fixture(scope="module")
 def mock_servers():
-    proc_a = subprocess.Popen(
-        [sys.executable, str(MOCK_SERVER_SCRIPT), "--port", "8081", "--id", "A"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    proc_b = subprocess.Popen(
-        [sys.executable, str(MOCK_SERVER_SCRIPT), "--port", "8082", "--id", "B"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    if not wait_for_server("127.0.0.1", 8081) or not wait_for_server("127.0.0.1", 8082):
-        proc_a.terminate()
-        proc_b.terminate()
-        pytest.fail("mock servers failed to start")
+    servers = []
+    try:
+        for port, server_id in ((8081, "A"), (8082, "B")):
+            servers.append(start_in_thread(port, server_id))
+    except OSError as e:
+        stop_mock_servers(servers)
+        pytest.fail(f"mock servers failed to start: {e}")
 
     yield
 
-    proc_a.terminate()
-    proc_b.terminate()
+    stop_mock_servers(servers)
 
 
 @pytest.fixture(scope="module")
-def apex_server(mock_servers):
+def apex_process():
+    if not APEX_BIN.exists():
+        pytest.skip(f"{APEX_BIN} not found; run `cargo build` first")
+
     config = {
         "version": "1.0",
         "global": {
@@ -162,8 +180,7 @@ def apex_server(mock_servers):
     }
 
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_PATH.write_text(json.dumps(config, separators=(",", ":")))
 
     with open(SERVER_LOG, "w") as log_file:
         proc = subprocess.Popen(
@@ -180,12 +197,7 @@ def apex_server(mock_servers):
             text=True,
         )
 
-    if not wait_for_server("127.0.0.1", 18080):
-        proc.terminate()
-        logs = SERVER_LOG.read_text() if SERVER_LOG.exists() else ""
-        pytest.fail(f"Apex failed to start:\n{logs}")
-
-    yield "http://127.0.0.1:18080"
+    yield proc
 
     proc.terminate()
     try:
@@ -197,16 +209,27 @@ def apex_server(mock_servers):
         CONFIG_PATH.unlink()
 
 
+# Apex is launched before the mock servers so its startup overlaps theirs
+@pytest.fixture(scope="module")
+def apex_server(apex_process, mock_servers):
+    if not wait_for_server("127.0.0.1", 18080, proc=apex_process):
+        logs = SERVER_LOG.read_text() if SERVER_LOG.exists() else ""
+        pytest.fail(f"Apex failed to start:\n{logs}")
+
+    yield "http://127.0.0.1:18080"
+
+
 def send_request(base_url: str, model: str):
     headers = {
         "Authorization": "Bearer sk-router-test",
         "Content-Type": "application/json",
+        "Connection": "keep-alive",
     }
     data = {
         "model": model,
         "messages": [{"role": "user", "content": "Hello"}],
     }
-    response = requests.post(
+    response = _SESSION.post(
         f"{base_url}/v1/chat/completions", headers=headers, json=data, timeout=5
     )
     assert response.status_code == 200, response.text
@@ -221,10 +244,11 @@ def test_priority_strategy(apex_server):
 
 
 def test_round_robin_strategy(apex_server):
-    responses = []
-    for _ in range(12):
-        resp = send_request(apex_server, "rr-test")
-        responses.append(resp["choices"][0]["message"]["content"])
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: send_request(apex_server, "rr-test"), range(12))
+        )
+    responses = [resp["choices"][0]["message"]["content"] for resp in results]
 
     a_count = sum(1 for r in responses if "Response from A" in r)
     b_count = sum(1 for r in responses if "Response from B" in r)